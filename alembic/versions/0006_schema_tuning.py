@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "0006_schema_tuning"
+down_revision = "0005_app_config"
+branch_labels = None
+depends_on = None
+
+# SQLite reflects the unnamed UNIQUE(token) from 0001 without a name; batch mode names it
+# through this convention so it can be dropped. Postgres named it drafts_token_key. The
+# SQLite rebuild also names the other unnamed UNIQUE on drafts, which becomes
+# uq_drafts_approval_idempotency_key.
+_SQLITE_NAMING = {"uq": "uq_%(table_name)s_%(column_0_name)s"}
+
+# Tables whose rows are updated in place many times (status, timestamps, pipeline JSON,
+# last_seen_at). Spare room on each page lets those updates stay HOT.
+_FILLFACTOR_TABLES = ("runs", "drafts", "publish_attempts", "user_sessions")
+
+# Append-only tables whose SERIAL ids become BIGINT identity columns so they cannot run
+# out of 32-bit ids.
+_BIGINT_ID_TABLES = ("posts", "agent_logs", "policy_reports", "publish_attempts", "audit_logs")
+
+
+def _drafts_token_unique_name() -> str:
+    if op.get_context().dialect.name == "postgresql":
+        return "drafts_token_key"
+    return "uq_drafts_token"
+
+
+def upgrade() -> None:
+    # Nothing looks drafts up by token (action_tokens.token_hash is the lookup path), so
+    # its unique index is pure write overhead.
+    with op.batch_alter_table("drafts", naming_convention=_SQLITE_NAMING) as batch:
+        batch.drop_constraint(_drafts_token_unique_name(), type_="unique")
+
+    # ix_drafts_status gives way to a (status, created_at) index that also serves the
+    # status-filtered, created_at-ordered draft listing, terminal statuses included.
+    op.drop_index("ix_drafts_status", table_name="drafts")
+    op.create_index("ix_drafts_status_created_at", "drafts", ["status", "created_at"])
+
+    if op.get_context().dialect.name != "postgresql":
+        return
+
+    # Applies to pages written from now on; existing pages keep their layout until the
+    # table is rewritten (VACUUM FULL / pg_repack).
+    for table in _FILLFACTOR_TABLES:
+        op.execute(f"ALTER TABLE {table} SET (fillfactor = 80)")
+
+    for table in _BIGINT_ID_TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT")
+        op.execute(f"DROP SEQUENCE IF EXISTS {table}_id_seq")
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id TYPE BIGINT")
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id ADD GENERATED BY DEFAULT AS IDENTITY")
+        op.execute(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+            f"COALESCE(MAX(id), 0) + 1, false) FROM {table}"
+        )
+
+    # Token lookups only ever want unconsumed tokens.
+    op.drop_index("ix_action_tokens_action_draft", table_name="action_tokens")
+    op.create_index(
+        "ix_action_tokens_action_draft",
+        "action_tokens",
+        ["action", "draft_id"],
+        postgresql_where=sa.text("consumed_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name == "postgresql":
+        op.drop_index("ix_action_tokens_action_draft", table_name="action_tokens")
+        op.create_index("ix_action_tokens_action_draft", "action_tokens", ["action", "draft_id"])
+
+        for table in _BIGINT_ID_TABLES:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP IDENTITY")
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN id TYPE INTEGER")
+            op.execute(f"CREATE SEQUENCE {table}_id_seq AS INTEGER OWNED BY {table}.id")
+            op.execute(
+                f"SELECT setval('{table}_id_seq', COALESCE(MAX(id), 0) + 1, false) FROM {table}"
+            )
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT nextval('{table}_id_seq')")
+
+        for table in _FILLFACTOR_TABLES:
+            op.execute(f"ALTER TABLE {table} RESET (fillfactor)")
+
+    op.drop_index("ix_drafts_status_created_at", table_name="drafts")
+    op.create_index("ix_drafts_status", "drafts", ["status"])
+
+    with op.batch_alter_table("drafts", naming_convention=_SQLITE_NAMING) as batch:
+        batch.create_unique_constraint(_drafts_token_unique_name(), ["token"])
@@ -1,18 +1,42 @@
 import logging
+import time
 from abc import ABC, abstractmethod
-from datetime import UTC, datetime
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from pydantic import BaseModel
 
 from app.models import AgentLog, Materials
 
+try:
+    from app.observability.metrics import AGENT_LATENCY_SECONDS
+except Exception:
+    AGENT_LATENCY_SECONDS = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
+def _summarize_materials(data: Materials) -> str:
+    return (
+        f"Materials(git_commits={len(data.git_commits)}, "
+        f"notes={len(data.notes)}, links={len(data.links)}, errors={len(data.errors)})"
+    )
+
+
+_SUMMARY_FORMATTERS: dict[type, Callable[[Any], str]] = {
+    Materials: _summarize_materials,
+    list: lambda data: f"list(len={len(data)})",
+    tuple: lambda data: f"tuple(len={len(data)})",
+}
+
+
 class BaseAgent(ABC):
     def __init__(self, name: str):
         self.name = name
+        self._latency = (
+            AGENT_LATENCY_SECONDS.labels(agent=name) if AGENT_LATENCY_SECONDS is not None else None
+        )
 
     @abstractmethod
     def run(self, input_data: Any) -> Any:
@@ -22,11 +46,9 @@ class BaseAgent(ABC):
         try:
             if data is None:
                 return "None"
-            if isinstance(data, Materials):
-                return (
-                    f"Materials(git_commits={len(data.git_commits)}, "
-                    f"notes={len(data.notes)}, links={len(data.links)}, errors={len(data.errors)})"
-                )
+            formatter = _SUMMARY_FORMATTERS.get(type(data))
+            if formatter is not None:
+                return formatter(data)
             if isinstance(data, BaseModel):
                 return data.__class__.__name__
             if isinstance(data, list | tuple):
@@ -37,6 +59,7 @@ class BaseAgent(ABC):
 
     def execute(self, input_data: Any) -> tuple[Any, AgentLog]:
         start_ts = datetime.now(UTC)
+        start_ns = time.perf_counter_ns()
         error_msg = None
         output_data = None
         warnings: list[str] = []
@@ -51,8 +74,9 @@ class BaseAgent(ABC):
             # We'll re-raise so orchestrator sees it immediately.
             raise e
         finally:
-            end_ts = datetime.now(UTC)
-            duration_ms = int((end_ts - start_ts).total_seconds() * 1000)
+            elapsed_ns = time.perf_counter_ns() - start_ns
+            duration_ms = elapsed_ns // 1_000_000
+            end_ts = start_ts + timedelta(microseconds=elapsed_ns // 1_000)
             input_summary = self._summarize(input_data)
             output_summary = self._summarize(output_data)
 
@@ -74,12 +98,8 @@ class BaseAgent(ABC):
                 errors=error_msg,
                 warnings=warnings,
             )
-            try:
-                from app.observability.metrics import AGENT_LATENCY_SECONDS
-
-                AGENT_LATENCY_SECONDS.labels(agent=self.name).observe(duration_ms / 1000.0)
-            except Exception:
-                pass
+            if self._latency is not None:
+                self._latency.observe(duration_ms / 1000.0)
             logger.info("[%s] Finished in %sms", self.name, duration_ms)
 
         return output_data, log
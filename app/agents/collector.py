@@ -1,6 +1,10 @@
 import os
+import re
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
+from typing import Any
 
 from app.agents.base import BaseAgent
 from app.config import settings
@@ -10,10 +14,30 @@ from app.sources.github_source import GitHubSource
 from app.sources.notion_source import NotionSource
 from app.sources.rss_source import RSSSource
 
+_TRUTHY = frozenset({"true", "1", "yes"})
+_GIT_LOG_LINE = re.compile(rb"^([0-9a-f]+)\|(\d+)\|(.*?)[ \t\r]*$", re.MULTILINE)
+
+# Collection results keyed by what invalidates them: (repo_path, hours) -> (HEAD oid, commits)
+# and devlog path -> ((mtime_ns, size, char_limit), item).
+_git_cache: dict[tuple[str, int], tuple[str, list[EvidenceItem]]] = {}
+_devlog_cache: dict[str, tuple[tuple[int, int, int], EvidenceItem]] = {}
+
+
+def _flag_enabled(name: str) -> bool:
+    return str(getattr(settings, name, "false")).lower() in _TRUTHY
+
 
 class CollectorAgent(BaseAgent):
+    _OPTIONAL_SOURCES: tuple[tuple[str, type[SourcePlugin]], ...] = (
+        ("ENABLE_SOURCE_NOTION", NotionSource),
+        ("ENABLE_SOURCE_GITHUB", GitHubSource),
+        ("ENABLE_SOURCE_RSS", RSSSource),
+    )
+
     def __init__(self):
         super().__init__("CollectorAgent")
+        self._sources: list[SourcePlugin] = []
+        self._sources_key: tuple[Any, ...] | None = None
 
     def run(self, run_state: RunState) -> Materials:
         errors: list[str] = []
@@ -24,20 +48,19 @@ class CollectorAgent(BaseAgent):
         links: list[EvidenceItem] = []
 
         sources = self._enabled_sources()
-        for src in sources:
+        with ThreadPoolExecutor(max_workers=max(1, len(sources))) as pool:
+            futures = [(src, pool.submit(src.fetch)) for src in sources]
+        for src, future in futures:
             try:
-                items = src.fetch()
+                items = future.result()
                 if src.name == "git":
                     git_commits.extend(items)
                     continue
                 if src.name == "devlog":
                     devlog = items[0] if items else None
                     continue
-                for item in items:
-                    if item.url:
-                        links.append(item)
-                    else:
-                        notes.append(item)
+                links.extend([item for item in items if item.url])
+                notes.extend([item for item in items if not item.url])
             except Exception as e:
                 errors.append(f"source:{src.name} failed: {str(e)[:200]}")
 
@@ -50,49 +73,103 @@ class CollectorAgent(BaseAgent):
         )
 
     def _enabled_sources(self) -> list[SourcePlugin]:
-        enabled: list[SourcePlugin] = [GitCommitsSource(), DevlogSource()]
-        if str(getattr(settings, "ENABLE_SOURCE_NOTION", "false")).lower() == "true":
-            enabled.append(NotionSource())
-        if str(getattr(settings, "ENABLE_SOURCE_GITHUB", "false")).lower() == "true":
-            enabled.append(GitHubSource())
-        if str(getattr(settings, "ENABLE_SOURCE_RSS", "false")).lower() == "true":
-            enabled.append(RSSSource())
-        return enabled
+        # Settings are re-read every run; the sources (and the git source's open repo)
+        # are only rebuilt when a setting they bind at construction has changed.
+        key = self._settings_key()
+        if key != self._sources_key:
+            self._sources = self._build_sources()
+            self._sources_key = key
+        return self._sources
+
+    def _settings_key(self) -> tuple[Any, ...]:
+        return (
+            tuple(_flag_enabled(flag) for flag, _ in self._OPTIONAL_SOURCES),
+            getattr(settings, "GIT_REPO_PATH", "."),
+            getattr(settings, "COLLECT_HOURS", 24),
+            getattr(settings, "DEVLOG_PATH", "devlog.md"),
+            getattr(settings, "DEVLOG_CHAR_LIMIT", 2000),
+        )
+
+    def _build_sources(self) -> list[SourcePlugin]:
+        core: list[SourcePlugin] = [GitCommitsSource(), DevlogSource()]
+        return core + [factory() for flag, factory in self._OPTIONAL_SOURCES if _flag_enabled(flag)]
 
 
 class GitCommitsSource(SourcePlugin):
     name = "git"
 
+    def __init__(self, repo_path: str | None = None, hours: int | None = None):
+        self.repo_path = repo_path or str(getattr(settings, "GIT_REPO_PATH", ".") or ".")
+        self.hours = hours or int(getattr(settings, "COLLECT_HOURS", 24) or 24)
+        self._repo: Any = None
+        self._repo_checked = False
+
     def fetch(self) -> list[EvidenceItem]:
-        repo_path = str(getattr(settings, "GIT_REPO_PATH", ".") or ".")
-        hours = int(getattr(settings, "COLLECT_HOURS", 24) or 24)
-        if not os.path.isdir(os.path.join(repo_path, ".git")):
+        if not os.path.isdir(os.path.join(self.repo_path, ".git")):
             return []
+        repo = self._open_repo()
+        if repo is not None:
+            return self._fetch_with_pygit2(repo)
+        return self._fetch_with_git_cli()
+
+    def _open_repo(self) -> Any:
+        if not self._repo_checked:
+            self._repo_checked = True
+            try:
+                import pygit2
+
+                self._repo = pygit2.Repository(self.repo_path)
+            except Exception:
+                self._repo = None
+        return self._repo
+
+    def _fetch_with_pygit2(self, repo: Any) -> list[EvidenceItem]:
+        import pygit2
+
+        if repo.head_is_unborn:
+            return []
+        cutoff = time.time() - self.hours * 3600
+        head = str(repo.head.target)
+        cache_key = (self.repo_path, self.hours)
+        cached = _git_cache.get(cache_key)
+        if cached is not None and cached[0] == head:
+            return [item for item in cached[1] if item.timestamp.timestamp() >= cutoff]
+
+        items: list[EvidenceItem] = []
+        for commit in repo.walk(repo.head.target, pygit2.GIT_SORT_TIME):
+            if commit.commit_time < cutoff:
+                break
+            subject = " ".join(commit.message.split("\n\n", 1)[0].split())
+            items.append(
+                EvidenceItem(
+                    source_name=self.name,
+                    source_id=str(commit.id),
+                    timestamp=datetime.fromtimestamp(commit.commit_time, tz=UTC),
+                    raw_snippet=subject,
+                    title=subject,
+                )
+            )
+        _git_cache[cache_key] = (head, items)
+        return list(items)
+
+    def _fetch_with_git_cli(self) -> list[EvidenceItem]:
         cmd = [
             "git",
             "-C",
-            repo_path,
+            self.repo_path,
             "log",
-            f"--since={hours}hours",
+            f"--since={self.hours}hours",
             "--pretty=format:%H|%ct|%s",
         ]
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        lines = [line.strip() for line in result.stdout.splitlines() if line.strip()]
+        result = subprocess.run(cmd, capture_output=True, check=True)
         items: list[EvidenceItem] = []
-        for line in lines:
-            parts = line.split("|", 2)
-            if len(parts) != 3:
-                continue
-            commit_hash, epoch_s, subject = parts
-            try:
-                ts = datetime.fromtimestamp(int(epoch_s), tz=UTC)
-            except Exception:
-                ts = datetime.now(UTC)
+        for m in _GIT_LOG_LINE.finditer(result.stdout):
+            subject = m.group(3).decode("utf-8", "replace")
             items.append(
                 EvidenceItem(
                     source_name=self.name,
-                    source_id=commit_hash,
-                    timestamp=ts,
+                    source_id=m.group(1).decode("ascii"),
+                    timestamp=datetime.fromtimestamp(int(m.group(2)), tz=UTC),
                     raw_snippet=subject,
                     title=subject,
                 )
@@ -103,24 +180,38 @@ class GitCommitsSource(SourcePlugin):
 class DevlogSource(SourcePlugin):
     name = "devlog"
 
+    def __init__(self, file_path: str | None = None, char_limit: int | None = None):
+        self.file_path = file_path or str(
+            getattr(settings, "DEVLOG_PATH", "devlog.md") or "devlog.md"
+        )
+        self.char_limit = char_limit or int(getattr(settings, "DEVLOG_CHAR_LIMIT", 2000) or 2000)
+
     def fetch(self) -> list[EvidenceItem]:
-        file_path = str(getattr(settings, "DEVLOG_PATH", "devlog.md") or "devlog.md")
-        char_limit = int(getattr(settings, "DEVLOG_CHAR_LIMIT", 2000) or 2000)
-        if not os.path.exists(file_path):
+        file_path = self.file_path
+        char_limit = self.char_limit
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
             return []
-        with open(file_path, encoding="utf-8") as f:
-            f.seek(0, os.SEEK_END)
-            size = f.tell()
-            start = max(0, size - char_limit)
-            f.seek(start)
-            content = f.read().strip()
-        mtime = datetime.fromtimestamp(os.path.getmtime(file_path), tz=UTC)
-        return [
-            EvidenceItem(
-                source_name=self.name,
-                source_id=os.path.abspath(file_path),
-                timestamp=mtime,
-                raw_snippet=content,
-                title=os.path.basename(file_path),
-            )
-        ]
+        cache_key = (st.st_mtime_ns, st.st_size, char_limit)
+        cached = _devlog_cache.get(file_path)
+        if cached is not None and cached[0] == cache_key:
+            return [cached[1]]
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            # char_limit counts characters; a UTF-8 character is at most 4 bytes.
+            start = max(0, st.st_size - char_limit * 4)
+            data = os.pread(fd, st.st_size - start, start)
+        finally:
+            os.close(fd)
+        content = data.decode("utf-8", errors="ignore")[-char_limit:].strip()
+        mtime = datetime.fromtimestamp(st.st_mtime, tz=UTC)
+        item = EvidenceItem(
+            source_name=self.name,
+            source_id=os.path.abspath(file_path),
+            timestamp=mtime,
+            raw_snippet=content,
+            title=os.path.basename(file_path),
+        )
+        _devlog_cache[file_path] = (cache_key, item)
+        return [item]
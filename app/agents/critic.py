@@ -1,7 +1,5 @@
 import json
 
-from openai import OpenAI
-
 from app.agents.base import BaseAgent
 from app.config import settings
 from app.models import (
@@ -11,16 +9,15 @@ from app.models import (
     StyleProfile,
     ThreadPlan,
 )
+from app.services.llm_cache import cached_json_completion
+from app.services.llm_client import get_openrouter_client
 from app.services.retry import with_retry
 
 
 class CriticAgent(BaseAgent):
     def __init__(self):
         super().__init__("CriticAgent")
-        self.client = OpenAI(
-            base_url=settings.OPENROUTER_BASE_URL,
-            api_key=settings.OPENROUTER_API_KEY,
-        )
+        self.client = get_openrouter_client()
 
     def run(
         self, input_data: tuple[DraftCandidates, Materials, StyleProfile, ThreadPlan]
@@ -62,15 +59,9 @@ Return JSON only:
 }}
 """
 
-        resp = with_retry(
-            lambda: self.client.chat.completions.create(
-                model=settings.OPENROUTER_MODEL,
-                messages=[{"role": "user", "content": prompt}],
-                response_format={"type": "json_object"},
-            ),
-            max_attempts=3,
+        data = cached_json_completion(
+            settings.OPENROUTER_MODEL, prompt, lambda: self._complete(prompt)
         )
-        data = json.loads(resp.choices[0].message.content)
         edited = EditedDraft(**data)
 
         if edited.mode == "thread" and edited.final_tweets and thread_plan.numbering_enabled:
@@ -79,15 +70,28 @@ Return JSON only:
             edited.numbering_added = True
         return edited
 
+    def _complete(self, prompt: str) -> str | None:
+        response = with_retry(
+            lambda: self.client.chat.completions.create(
+                model=settings.OPENROUTER_MODEL,
+                messages=[{"role": "user", "content": prompt}],
+                response_format={"type": "json_object"},
+            ),
+            max_attempts=3,
+        )
+        content: str | None = response.choices[0].message.content
+        return content
+
 
 def _add_numbering(tweets: list[str]) -> list[str]:
     n = len(tweets)
+    # " (i/n)" is len(str(i)) + len(str(n)) + 4 characters.
+    fixed = len(str(n)) + 4
     out: list[str] = []
     for i, t in enumerate(tweets, start=1):
-        suffix = f" ({i}/{n})"
         text = t.strip()
-        if len(text) + len(suffix) <= 280:
-            out.append(text + suffix)
-        else:
-            out.append(text[: max(0, 280 - len(suffix))].rstrip() + suffix)
+        budget = 280 - fixed - len(str(i))
+        if len(text) > budget:
+            text = text[: max(0, budget)].rstrip()
+        out.append(f"{text} ({i}/{n})")
     return out
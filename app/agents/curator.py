@@ -1,20 +1,17 @@
 import json
 
-from openai import OpenAI
-
 from app.agents.base import BaseAgent
 from app.config import settings
 from app.models import Materials, TopicPlan
+from app.services.llm_cache import cached_json_completion
+from app.services.llm_client import get_openrouter_client
 from app.services.retry import with_retry
 
 
 class CuratorAgent(BaseAgent):
     def __init__(self):
         super().__init__("CuratorAgent")
-        self.client = OpenAI(
-            base_url=settings.OPENROUTER_BASE_URL,
-            api_key=settings.OPENROUTER_API_KEY,
-        )
+        self.client = get_openrouter_client()
 
     def run(self, input_data: tuple[Materials, list[str]]) -> TopicPlan:
         materials, recent_posts = input_data
@@ -56,15 +53,9 @@ Output JSON only:
 """
 
         try:
-            response = with_retry(
-                lambda: self.client.chat.completions.create(
-                    model=settings.OPENROUTER_MODEL,
-                    messages=[{"role": "user", "content": prompt}],
-                    response_format={"type": "json_object"},
-                ),
-                max_attempts=3,
+            data = cached_json_completion(
+                settings.OPENROUTER_MODEL, prompt, lambda: self._complete(prompt)
             )
-            data = json.loads(response.choices[0].message.content)
             return TopicPlan(**data)
         except Exception:
             return TopicPlan(
@@ -73,3 +64,15 @@ Output JSON only:
                 key_points=["A small, honest reflection is better than a vague claim"],
                 evidence_map={},
             )
+
+    def _complete(self, prompt: str) -> str | None:
+        response = with_retry(
+            lambda: self.client.chat.completions.create(
+                model=settings.OPENROUTER_MODEL,
+                messages=[{"role": "user", "content": prompt}],
+                response_format={"type": "json_object"},
+            ),
+            max_attempts=3,
+        )
+        content: str | None = response.choices[0].message.content
+        return content
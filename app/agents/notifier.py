@@ -1,7 +1,12 @@
+import html
 import logging
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 
 import requests
-from jinja2 import Template
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from app.agents.base import BaseAgent
 from app.config import settings
@@ -9,115 +14,138 @@ from app.models import ApprovedDraftRecord, NotificationResult
 from app.services.email_service import send_email_html
 from app.services.whatsapp_service import send_whatsapp
 
+try:
+    from app.observability.metrics import NOTIFY_TOTAL
+except Exception:
+    NOTIFY_TOTAL = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+_SLACK_SESSION = requests.Session()
+_SLACK_SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=Retry(total=2, backoff_factor=0.3)),
+)
+
+
+@dataclass(frozen=True)
+class _ActionLinks:
+    approve: str
+    edit: str
+    skip: str
+
+    @classmethod
+    def for_record(cls, record: ApprovedDraftRecord) -> "_ActionLinks":
+        base_url = settings.BASE_PUBLIC_URL.rstrip("/")
+        return cls(
+            approve=f"{base_url}/approve/{record.approve_token}",
+            edit=f"{base_url}/edit/{record.edit_token}",
+            skip=f"{base_url}/skip/{record.skip_token}",
+        )
+
+
+_Sender = Callable[[ApprovedDraftRecord, _ActionLinks, list[str]], bool]
+
 
 class NotifierAgent(BaseAgent):
     def __init__(self):
         super().__init__("NotifierAgent")
 
     def run(self, record: ApprovedDraftRecord) -> NotificationResult:
-        errors: list[str] = []
-        email_ok = self._send_email(record, errors)
-        try:
-            from app.observability.metrics import NOTIFY_TOTAL
-
-            NOTIFY_TOTAL.labels(channel="email", status=("success" if email_ok else "failed")).inc()
-        except Exception:
-            pass
-        slack_ok = False
+        channels: list[tuple[str, _Sender]] = [("email", self._send_email)]
         if bool(getattr(settings, "ENABLE_SLACK", False)) and getattr(
             settings, "SLACK_WEBHOOK_URL", None
         ):
-            slack_ok = self._send_slack(record, errors)
-            try:
-                from app.observability.metrics import NOTIFY_TOTAL
-
-                NOTIFY_TOTAL.labels(
-                    channel="slack", status=("success" if slack_ok else "failed")
-                ).inc()
-            except Exception:
-                pass
-        wa_ok = False
+            channels.append(("slack", self._send_slack))
         if settings.ENABLE_WHATSAPP:
-            wa_ok = self._send_whatsapp(record, errors)
-            try:
-                from app.observability.metrics import NOTIFY_TOTAL
-
-                NOTIFY_TOTAL.labels(
-                    channel="whatsapp", status=("success" if wa_ok else "failed")
-                ).inc()
-            except Exception:
-                pass
+            channels.append(("whatsapp", self._send_whatsapp))
+
+        links = _ActionLinks.for_record(record)
+        with ThreadPoolExecutor(max_workers=len(channels)) as pool:
+            futures = [
+                (name, pool.submit(self._dispatch, name, send, record, links))
+                for name, send in channels
+            ]
+        results: dict[str, bool] = {}
+        errors: list[str] = []
+        for name, future in futures:
+            ok, channel_errors = future.result()
+            results[name] = ok
+            errors.extend(channel_errors)
+
+        return NotificationResult(
+            email_sent=results["email"],
+            whatsapp_sent=results.get("whatsapp", False),
+            errors=errors,
+        )
 
-        return NotificationResult(email_sent=email_ok, whatsapp_sent=wa_ok, errors=errors)
+    @staticmethod
+    def _dispatch(
+        channel: str,
+        send: _Sender,
+        record: ApprovedDraftRecord,
+        links: _ActionLinks,
+    ) -> tuple[bool, list[str]]:
+        errors: list[str] = []
+        ok = send(record, links, errors)
+        if NOTIFY_TOTAL is not None:
+            NOTIFY_TOTAL.labels(channel=channel, status=("success" if ok else "failed")).inc()
+        return ok, errors
 
     def _render_text(self, record: ApprovedDraftRecord) -> str:
         if record.mode == "thread" and record.tweets:
             return "\n\n".join(record.tweets)
         return record.text or ""
 
-    def _send_email(self, record: ApprovedDraftRecord, errors: list[str]) -> bool:
+    def _send_email(
+        self, record: ApprovedDraftRecord, links: _ActionLinks, errors: list[str]
+    ) -> bool:
         preview = record.text or (record.tweets[0] if record.tweets else "")
         subject = f"Daily X Draft: {record.policy_report.action} - {preview[:30]}..."
 
-        base_url = settings.BASE_PUBLIC_URL.rstrip("/")
-        approve_link = f"{base_url}/approve/{record.approve_token}"
-        edit_link = f"{base_url}/edit/{record.edit_token}"
-        skip_link = f"{base_url}/skip/{record.skip_token}"
-
-        rendered_text = self._render_text(record)
-        template = Template(
-            """
-<h2>Daily X Draft ({{ risk_level }})</h2>
-<p><strong>Policy Action:</strong> {{ action }}</p>
+        checks = "".join(
+            f"\n  <li>{html.escape(c.check_name)}: {'PASS' if c.passed else 'FAIL'}"
+            f" - {html.escape(c.details)}</li>"
+            for c in record.policy_report.checks
+        )
+        body = f"""
+<h2>Daily X Draft ({html.escape(str(record.policy_report.risk_level))})</h2>
+<p><strong>Policy Action:</strong> {html.escape(str(record.policy_report.action))}</p>
 <div style="border: 1px solid #ccc; padding: 15px; background: #f9f9f9; margin: 10px 0;">
-  <pre style="white-space: pre-wrap; font-size: 14px;">{{ rendered_text }}</pre>
+  <pre style="white-space: pre-wrap; font-size: 14px;">{html.escape(self._render_text(record))}</pre>
 </div>
 
 <h3>Policy Check:</h3>
-<ul>
-{% for c in checks %}
-  <li>{{ c.check_name }}: {{ "PASS" if c.passed else "FAIL" }} - {{ c.details }}</li>
-{% endfor %}
+<ul>{checks}
 </ul>
 
 <div style="margin-top: 20px;">
-  <a href="{{ approve_link }}" style="background:green; color:white; padding:10px 20px; text-decoration:none; margin-right:10px;">Approve &amp; Post</a>
-  <a href="{{ edit_link }}" style="background:blue; color:white; padding:10px 20px; text-decoration:none; margin-right:10px;">Edit</a>
-  <a href="{{ skip_link }}" style="background:gray; color:white; padding:10px 20px; text-decoration:none;">Skip</a>
+  <a href="{links.approve}" style="background:green; color:white; padding:10px 20px; text-decoration:none; margin-right:10px;">Approve &amp; Post</a>
+  <a href="{links.edit}" style="background:blue; color:white; padding:10px 20px; text-decoration:none; margin-right:10px;">Edit</a>
+  <a href="{links.skip}" style="background:gray; color:white; padding:10px 20px; text-decoration:none;">Skip</a>
 </div>
 """
-        )
-        html = template.render(
-            risk_level=str(record.policy_report.risk_level),
-            action=str(record.policy_report.action),
-            rendered_text=rendered_text,
-            checks=list(record.policy_report.checks),
-            approve_link=approve_link,
-            edit_link=edit_link,
-            skip_link=skip_link,
-        )
 
         try:
-            send_email_html(subject, html)
+            send_email_html(subject, body)
             return True
         except Exception as e:
             errors.append(f"email_failed:{str(e)[:200]}")
             logger.error("Email failed", exc_info=True)
             return False
 
-    def _send_whatsapp(self, record: ApprovedDraftRecord, errors: list[str]) -> bool:
+    def _send_whatsapp(
+        self, record: ApprovedDraftRecord, links: _ActionLinks, errors: list[str]
+    ) -> bool:
         try:
-            base_url = settings.BASE_PUBLIC_URL.rstrip("/")
             text = self._render_text(record).strip().replace("\n\n", "\n")
             snippet = (text[:240] + "…") if len(text) > 240 else text
             body = (
                 f"Draft ({record.policy_report.action}/{record.policy_report.risk_level}):\n"
                 f"{snippet}\n\n"
-                f"Approve: {base_url}/approve/{record.approve_token}\n"
-                f"Edit: {base_url}/edit/{record.edit_token}\n"
-                f"Skip: {base_url}/skip/{record.skip_token}"
+                f"Approve: {links.approve}\n"
+                f"Edit: {links.edit}\n"
+                f"Skip: {links.skip}"
             )
             send_whatsapp(body)
             return True
@@ -125,27 +153,24 @@ class NotifierAgent(BaseAgent):
             errors.append("whatsapp_failed")
             return False
 
-    def _send_slack(self, record: ApprovedDraftRecord, errors: list[str]) -> bool:
+    def _send_slack(
+        self, record: ApprovedDraftRecord, links: _ActionLinks, errors: list[str]
+    ) -> bool:
         try:
             webhook = str(getattr(settings, "SLACK_WEBHOOK_URL", "") or "")
             if not webhook:
                 return False
 
-            base_url = settings.BASE_PUBLIC_URL.rstrip("/")
-            approve_link = f"{base_url}/approve/{record.approve_token}"
-            edit_link = f"{base_url}/edit/{record.edit_token}"
-            skip_link = f"{base_url}/skip/{record.skip_token}"
-
             text = self._render_text(record).strip().replace("\n\n", "\n")
             snippet = (text[:800] + "…") if len(text) > 800 else text
             payload = {
                 "text": (
                     f"*Daily X Draft* ({record.policy_report.action}/{record.policy_report.risk_level})\n"
                     f"{snippet}\n\n"
-                    f"<{approve_link}|Approve> • <{edit_link}|Edit> • <{skip_link}|Skip>"
+                    f"<{links.approve}|Approve> • <{links.edit}|Edit> • <{links.skip}|Skip>"
                 )
             }
-            resp = requests.post(webhook, json=payload, timeout=10)
+            resp = _SLACK_SESSION.post(webhook, json=payload, timeout=10)
             if resp.status_code >= 400:
                 errors.append(f"slack_failed:{resp.status_code}")
                 return False
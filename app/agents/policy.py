@@ -1,9 +1,15 @@
+from __future__ import annotations
+
+import heapq
 import json
+import os
 import re
-from typing import Any
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 import yaml
-from openai import OpenAI
 
 from app.agents.base import BaseAgent
 from app.config import settings
@@ -17,6 +23,38 @@ from app.models import (
     StyleProfile,
 )
 from app.runtime_config import get_config
+from app.services.llm_client import get_openrouter_client
+
+if TYPE_CHECKING:
+    from openai import OpenAI
+
+# Words of three or more characters; a shorter run can never match, so no filter pass.
+_TOKEN_RE = re.compile(r"[A-Za-z0-9_]{3,}")
+_EMOJI_RE = re.compile(r"[\U0001F300-\U0001FAFF]")
+_SENTENCE_SPLIT_RE = re.compile(r"[\n\.!?]")
+_MARKETING_PHRASES = frozenset(
+    {"game changer", "revolutionary", "explosive growth", "world changing"}
+)
+_EXAGGERATION_MARKERS = frozenset(
+    {"insane", "unbelievable", "guarantee", "always", "never", "massive"}
+)
+_OPINION_MARKERS = ("i think", "i feel", "my take", "opinion", "i learned", "lesson")
+# Searched independently, since one secret often matches several categories (a JWT is
+# also a long base64 run) and each of them is reported. Kept in alphabetical order.
+_LEAK_PATTERNS = (
+    ("api_key_like", re.compile(r"\bsk-[A-Za-z0-9]{20,}\b")),
+    ("aws_access_key_id", re.compile(r"\bAKIA[0-9A-Z]{16}\b")),
+    ("jwt", re.compile(r"\beyJ[A-Za-z0-9_-]{10,}\.[A-Za-z0-9_-]{10,}\.[A-Za-z0-9_-]{10,}\b")),
+    ("long_base64_token", re.compile(r"\b[A-Za-z0-9+/]{40,}={0,2}\b")),
+    ("long_hex_token", re.compile(r"\b[a-fA-F0-9]{40,}\b")),
+)
+
+_CHECKS_SKIPPED_ON_HOLD = ("similarity_ok", "thread_marker_ok", "tone_ok", "fact_grounded_ok")
+
+_CLAIMS_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="policy-claims")
+
+# Parsed blocked-terms files keyed by path -> (mtime_ns, terms).
+_blocked_terms_cache: dict[str, tuple[int, list[str]]] = {}
 
 
 class PolicyAgent(BaseAgent):
@@ -31,6 +69,7 @@ class PolicyAgent(BaseAgent):
         edited, materials, recent_posts, style = input_data
 
         tweets = _edited_to_tweets(edited)
+        lowered = [t.lower() for t in tweets]
         blocked_terms = _load_blocked_terms(
             getattr(settings, "BLOCKED_TERMS_PATH", "./blocked_terms.yaml")
         )
@@ -44,7 +83,7 @@ class PolicyAgent(BaseAgent):
             PolicyCheckResult(check_name="length_ok", passed=length_ok, details=length_details)
         )
 
-        sensitive_ok, sensitive_hits = _check_blocked_terms(tweets, blocked_terms)
+        sensitive_ok, sensitive_hits = _check_blocked_terms(lowered, blocked_terms)
         checks.append(
             PolicyCheckResult(
                 check_name="sensitive_ok",
@@ -54,7 +93,7 @@ class PolicyAgent(BaseAgent):
         )
         offending_spans.extend(sensitive_hits)
 
-        leakage_ok, leakage_hits = _check_sensitive_leakage(tweets)
+        leakage_ok, leakage_hits = _check_sensitive_leakage(tweets, lowered)
         checks.append(
             PolicyCheckResult(
                 check_name="leakage_ok",
@@ -64,7 +103,32 @@ class PolicyAgent(BaseAgent):
         )
         offending_spans.extend(leakage_hits)
 
-        similarity_ok, sim_details = _check_similarity(tweets, recent_posts, similarity_threshold)
+        if not (sensitive_ok and leakage_ok):
+            # Either failure is already a HIGH-risk HOLD whatever the remaining checks
+            # say, so skip them, including the optional LLM claim extraction. Skipped
+            # checks are not reported as passed; reviewers would read that as clean.
+            checks.extend(
+                PolicyCheckResult(check_name=name, passed=False, details="skipped (HOLD)")
+                for name in _CHECKS_SKIPPED_ON_HOLD
+            )
+            return PolicyReport(
+                checks=checks,
+                risk_level="HIGH",
+                action="HOLD",
+                offending_spans=offending_spans,
+            )
+
+        # The LLM round trip dominates; start it now so it overlaps the checks below.
+        claims_future = (
+            _CLAIMS_EXECUTOR.submit(_extract_claims, tweets, self._claims_client)
+            if _llm_claims_enabled()
+            else None
+        )
+
+        tweet_tokens = [_tokenize(t) for t in tweets]
+        similarity_ok, sim_details = _check_similarity(
+            tweet_tokens, recent_posts, similarity_threshold
+        )
         checks.append(
             PolicyCheckResult(check_name="similarity_ok", passed=similarity_ok, details=sim_details)
         )
@@ -78,10 +142,14 @@ class PolicyAgent(BaseAgent):
             )
         )
 
-        tone_ok, tone_details = _check_tone(tweets, style)
+        tone_ok, tone_details = _check_tone(tweets, lowered, style)
         checks.append(PolicyCheckResult(check_name="tone_ok", passed=tone_ok, details=tone_details))
 
-        claims = _extract_claims(tweets, self._claims_client)
+        claims = (
+            claims_future.result()
+            if claims_future is not None
+            else _extract_claims(tweets, self._claims_client)
+        )
         evidence_map, unsupported = _map_evidence(claims, materials)
         fact_ok = len(unsupported) == 0
         checks.append(
@@ -138,47 +206,83 @@ def _load_blocked_terms(path: str) -> list[str]:
     if isinstance(value, list) and value:
         return [str(t).strip().lower() for t in value if str(t).strip()]
     try:
-        with open(path, encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
-        terms = data.get("blocked_terms", [])
-        return [str(t).strip().lower() for t in terms if str(t).strip()]
+        return _read_blocked_terms_file(path)
     except Exception:
         return [w.strip().lower() for w in settings.sensitive_words_list]
 
 
-def _check_blocked_terms(tweets: list[str], blocked_terms: list[str]) -> tuple[bool, list[str]]:
-    hits: list[str] = []
-    for t in tweets:
-        low = t.lower()
-        for term in blocked_terms:
-            if term and term in low:
-                hits.append(term)
-    return len(hits) == 0, sorted(set(hits))
+def _read_blocked_terms_file(path: str) -> list[str]:
+    mtime_ns = os.stat(path).st_mtime_ns
+    cached = _blocked_terms_cache.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    with open(path, encoding="utf-8") as f:
+        data = yaml.safe_load(f) or {}
+    raw_terms = data.get("blocked_terms", [])
+    terms = [str(t).strip().lower() for t in raw_terms if str(t).strip()]
+    _blocked_terms_cache[path] = (mtime_ns, terms)
+    return terms
+
+
+def _check_blocked_terms(lowered: list[str], blocked_terms: list[str]) -> tuple[bool, list[str]]:
+    terms = tuple(blocked_terms)
+    hits = list(dict.fromkeys(term for low in lowered for term in _phrase_hits(low, terms)))
+    return len(hits) == 0, hits
+
+
+@lru_cache(maxsize=16)
+def _phrase_matcher(phrases: tuple[str, ...]) -> re.Pattern[str] | None:
+    alternatives = sorted({re.escape(p) for p in phrases if p}, key=len, reverse=True)
+    return re.compile("|".join(alternatives)) if alternatives else None
+
+
+def _phrase_hits(low: str, phrases: tuple[str, ...]) -> list[str]:
+    # One alternation scan rules out the common no-hit case; the containment checks
+    # then report overlapping phrases individually, as before.
+    matcher = _phrase_matcher(phrases)
+    if matcher is None or matcher.search(low) is None:
+        return []
+    return [p for p in phrases if p and p in low]
 
 
 def _tokenize(text: str) -> set[str]:
-    words = re.findall(r"[A-Za-z0-9_]+", text.lower())
-    return {w for w in words if len(w) >= 3}
+    return set(_TOKEN_RE.findall(text.lower()))
+
 
+def _index_tokens(token_sets: list[set[str]]) -> dict[str, list[int]]:
+    postings: dict[str, list[int]] = {}
+    for idx, tokens in enumerate(token_sets):
+        for token in tokens:
+            postings.setdefault(token, []).append(idx)
+    return postings
 
-def _jaccard(a: set[str], b: set[str]) -> float:
-    if not a or not b:
-        return 0.0
-    inter = len(a & b)
-    union = len(a | b)
-    return inter / union if union else 0.0
+
+def _overlap_scores(
+    query: set[str], postings: dict[str, list[int]], token_sets: list[set[str]]
+) -> list[tuple[int, float]]:
+    # Jaccard against every indexed set that shares a token with ``query``, in index
+    # order; disjoint sets score 0 and are never visited.
+    # |a union b| = |a| + |b| - |a intersect b|, so no union set is ever built.
+    overlap: Counter[int] = Counter()
+    for token in query:
+        overlap.update(postings.get(token, ()))
+    query_len = len(query)
+    return [
+        (idx, inter / (query_len + len(token_sets[idx]) - inter))
+        for idx, inter in sorted(overlap.items())
+    ]
 
 
 def _check_similarity(
-    tweets: list[str], recent_posts: list[str], threshold: float
+    tweet_tokens: list[set[str]], recent_posts: list[str], threshold: float
 ) -> tuple[bool, str]:
     if not recent_posts:
         return True, "no_recent_posts"
+    recent_tokens = [_tokenize(p) for p in recent_posts]
+    postings = _index_tokens(recent_tokens)
     worst = 0.0
-    for t in tweets:
-        tset = _tokenize(t)
-        for p in recent_posts:
-            score = _jaccard(tset, _tokenize(p))
+    for tokens in tweet_tokens:
+        for _, score in _overlap_scores(tokens, postings, recent_tokens):
             worst = max(worst, score)
             if score >= threshold:
                 return False, f"jaccard={score:.2f}>=threshold"
@@ -192,75 +296,45 @@ def _check_thread_markers(edited: EditedDraft, tweets: list[str]) -> tuple[bool,
     return len(markers) == 0, "ok" if not markers else "thread_marker_in_single"
 
 
-def _check_tone(tweets: list[str], style: StyleProfile) -> tuple[bool, str]:
-    forbidden = {p.lower() for p in style.forbidden_phrases}
-    marketing = ["game changer", "revolutionary", "explosive growth", "world changing"]
-    forbidden |= set(marketing)
+def _check_tone(tweets: list[str], lowered: list[str], style: StyleProfile) -> tuple[bool, str]:
     if any("#" in t for t in tweets):
         return False, "hashtags_not_allowed"
     if any(_contains_emoji(t) for t in tweets):
         return False, "emoji_not_allowed"
-    hits: list[str] = []
-    for t in tweets:
-        low = t.lower()
-        for phrase in forbidden:
-            if phrase and phrase in low:
-                hits.append(phrase)
+    forbidden = {p.lower() for p in style.forbidden_phrases} | _MARKETING_PHRASES
+    phrases = tuple(sorted(forbidden | _EXAGGERATION_MARKERS))
+    hits = dict.fromkeys(phrase for low in lowered for phrase in _phrase_hits(low, phrases))
+    forbidden_hits = [h for h in hits if h in forbidden]
+    if forbidden_hits:
+        return False, "forbidden_phrases=" + ",".join(forbidden_hits[:10])
     if hits:
-        return False, "forbidden_phrases=" + ",".join(sorted(set(hits))[:10])
-    if any(_is_exaggerated(t) for t in tweets):
         return False, "exaggeration_detected"
     return True, "ok"
 
 
 def _contains_emoji(text: str) -> bool:
-    return bool(re.search(r"[\U0001F300-\U0001FAFF]", text))
-
-
-def _is_exaggerated(text: str) -> bool:
-    low = text.lower()
-    patterns = ["insane", "unbelievable", "guarantee", "always", "never", "massive"]
-    return any(p in low for p in patterns)
+    # isascii() reads a flag on the str object, so plain-ASCII tweets skip the scan.
+    return not text.isascii() and _EMOJI_RE.search(text) is not None
 
 
-def _check_sensitive_leakage(tweets: list[str]) -> tuple[bool, list[str]]:
+def _check_sensitive_leakage(tweets: list[str], lowered: list[str]) -> tuple[bool, list[str]]:
     joined = "\n".join(tweets)
-    hits: list[str] = []
-
-    if "-----begin private key-----" in joined.lower():
+    hits = [kind for kind, pattern in _LEAK_PATTERNS if pattern.search(joined)]
+    if any("-----begin private key-----" in low for low in lowered):
         hits.append("private_key_block")
+    return len(hits) == 0, hits
 
-    jwt = re.findall(r"\beyJ[A-Za-z0-9_-]{10,}\.[A-Za-z0-9_-]{10,}\.[A-Za-z0-9_-]{10,}\b", joined)
-    if jwt:
-        hits.append("jwt")
-
-    openai_like = re.findall(r"\bsk-[A-Za-z0-9]{20,}\b", joined)
-    if openai_like:
-        hits.append("api_key_like")
-
-    aws_access = re.findall(r"\bAKIA[0-9A-Z]{16}\b", joined)
-    if aws_access:
-        hits.append("aws_access_key_id")
-
-    long_hex = re.findall(r"\b[a-f0-9]{40,}\b", joined.lower())
-    if long_hex:
-        hits.append("long_hex_token")
-
-    long_b64 = re.findall(r"\b[A-Za-z0-9+/]{40,}={0,2}\b", joined)
-    if long_b64:
-        hits.append("long_base64_token")
 
-    return len(hits) == 0, sorted(set(hits))
+def _llm_claims_enabled() -> bool:
+    raw_flag: Any = getattr(settings, "POLICY_LLM_CLAIMS_ENABLED", False)
+    llm_enabled = raw_flag if isinstance(raw_flag, bool) else str(raw_flag).lower() == "true"
+    return llm_enabled and bool(settings.OPENROUTER_API_KEY)
 
 
 def _extract_claims(tweets: list[str], client: OpenAI | None) -> list[str]:
-    raw_flag: Any = getattr(settings, "POLICY_LLM_CLAIMS_ENABLED", False)
-    llm_enabled = raw_flag if isinstance(raw_flag, bool) else str(raw_flag).lower() == "true"
-    if llm_enabled and settings.OPENROUTER_API_KEY:
+    if _llm_claims_enabled():
         try:
-            client = client or OpenAI(
-                base_url=settings.OPENROUTER_BASE_URL, api_key=settings.OPENROUTER_API_KEY
-            )
+            client = client or get_openrouter_client()
             prompt = f"""
 Extract factual claims from the text below.
 
@@ -292,7 +366,7 @@ Return JSON only:
 
     extracted_claims: list[str] = []
     for t in tweets:
-        parts = re.split(r"[\n\.!?]", t)
+        parts = _SENTENCE_SPLIT_RE.split(t)
         for p in parts:
             s = p.strip()
             if not s:
@@ -307,8 +381,7 @@ Return JSON only:
 
 def _looks_like_opinion(sentence: str) -> bool:
     low = sentence.lower()
-    markers = ["i think", "i feel", "my take", "opinion", "i learned", "lesson"]
-    return any(m in low for m in markers)
+    return any(m in low for m in _OPINION_MARKERS)
 
 
 def _materials_evidence(materials: Materials) -> list[EvidenceItem]:
@@ -325,18 +398,18 @@ def _map_evidence(
     claims: list[str], materials: Materials
 ) -> tuple[dict[str, list[EvidenceRef]], list[str]]:
     evidence_items = _materials_evidence(materials)
+    evidence_sets = [_tokenize(item.raw_snippet) for item in evidence_items]
+    postings = _index_tokens(evidence_sets)
     evidence_map: dict[str, list[EvidenceRef]] = {}
     unsupported: list[str] = []
     for claim in claims:
-        cset = _tokenize(claim)
-        scored: list[tuple[float, EvidenceItem]] = []
-        for item in evidence_items:
-            eset = _tokenize(item.raw_snippet)
-            score = _jaccard(cset, eset)
-            if score > 0:
-                scored.append((score, item))
-        scored.sort(key=lambda x: x[0], reverse=True)
-        top = [s for s in scored[:2] if s[0] >= 0.2]
+        scored = _overlap_scores(_tokenize(claim), postings, evidence_sets)
+        # nlargest keeps the same ties-by-index order as a full stable sort.
+        top = [
+            (score, evidence_items[idx])
+            for idx, score in heapq.nlargest(2, scored, key=lambda x: x[1])
+            if score >= 0.2
+        ]
         if not top:
             unsupported.append(claim)
             continue
@@ -1,3 +1,4 @@
+import random
 import time
 from datetime import UTC, datetime
 
@@ -13,10 +14,16 @@ from infrastructure.db.repositories import (
 )
 from infrastructure.db.session import get_sessionmaker
 
+_POST_ATTEMPTS = 3
+# The longest sleep the plain backoff has ever taken. A rate-limit reset further out
+# than this is not waited for inline, since publishing runs in the approval path.
+_MAX_RATE_LIMIT_WAIT_S = 2.0
+
 
 class PublisherAgent(BaseAgent):
     def __init__(self):
         super().__init__("PublisherAgent")
+        self._tweepy_client: tweepy.Client | None = None
 
     def run(self, request: PublishRequest) -> PublishResult:
         draft_id = request.draft_id
@@ -59,17 +66,21 @@ class PublisherAgent(BaseAgent):
             return PublishResult(tweet_ids=tweet_ids)
 
     def _client(self) -> tweepy.Client:
-        return tweepy.Client(
-            consumer_key=settings.TWITTER_API_KEY,
-            consumer_secret=settings.TWITTER_API_SECRET,
-            access_token=settings.TWITTER_ACCESS_TOKEN,
-            access_token_secret=settings.TWITTER_ACCESS_TOKEN_SECRET,
-        )
+        # One client per agent: its requests.Session keeps the connection to X alive
+        # across the tweets of a thread and across retries.
+        if self._tweepy_client is None:
+            self._tweepy_client = tweepy.Client(
+                consumer_key=settings.TWITTER_API_KEY,
+                consumer_secret=settings.TWITTER_API_SECRET,
+                access_token=settings.TWITTER_ACCESS_TOKEN,
+                access_token_secret=settings.TWITTER_ACCESS_TOKEN_SECRET,
+            )
+        return self._tweepy_client
 
     def _post_with_retry(self, text: str, reply_to: str | None) -> str:
         delay = 0.5
         last_err: Exception | None = None
-        for _ in range(3):
+        for attempt in range(1, _POST_ATTEMPTS + 1):
             try:
                 client = self._client()
                 resp = (
@@ -80,8 +91,27 @@ class PublisherAgent(BaseAgent):
                 if resp.data and resp.data.get("id"):
                     return str(resp.data["id"])
                 raise RuntimeError("No data in X response")
+            except tweepy.TooManyRequests as e:
+                wait_s = _rate_limit_wait_s(e, delay)
+                if wait_s > _MAX_RATE_LIMIT_WAIT_S:
+                    # Fail fast: the draft is marked errored and its approval can be
+                    # retried once the window has reset.
+                    raise
+                last_err = e
             except Exception as e:
                 last_err = e
-                time.sleep(delay)
+                # Jitter keeps workers that failed together from retrying together.
+                wait_s = delay + random.uniform(0, delay)
+            if attempt < _POST_ATTEMPTS:
+                time.sleep(wait_s)
                 delay *= 2
         raise last_err or RuntimeError("X post failed")
+
+
+def _rate_limit_wait_s(err: tweepy.TooManyRequests, fallback_s: float) -> float:
+    # X sends the window reset as epoch seconds.
+    try:
+        reset_at = float(err.response.headers["x-rate-limit-reset"])
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return fallback_s
+    return max(reset_at - time.time(), fallback_s)
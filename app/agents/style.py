@@ -1,20 +1,16 @@
 import json
 
-from openai import OpenAI
-
 from app.agents.base import BaseAgent
 from app.config import settings
 from app.models import StyleProfile
+from app.services.llm_client import get_openrouter_client
 from app.services.retry import with_retry
 
 
 class StyleAgent(BaseAgent):
     def __init__(self):
         super().__init__("StyleAgent")
-        self.client = OpenAI(
-            base_url=settings.OPENROUTER_BASE_URL,
-            api_key=settings.OPENROUTER_API_KEY,
-        )
+        self.client = get_openrouter_client()
 
     def run(self, input_data: tuple[list[str], str]) -> StyleProfile:
         posts, devlog_excerpt = input_data
@@ -43,8 +39,7 @@ Output a JSON style profile:
                 ),
                 max_attempts=3,
             )
-            data = json.loads(resp.choices[0].message.content)
-            return StyleProfile(**data)
+            return StyleProfile.model_validate_json(resp.choices[0].message.content or "")
         except Exception:
             return StyleProfile(
                 preferred_openers=["Today:", "One thing I learned:", "Quick note:"],
@@ -1,21 +1,17 @@
 import json
 
-from openai import OpenAI
-
 from app.agents.base import BaseAgent
 from app.config import settings
 from app.models import Materials, StyleProfile, ThreadPlan, TopicPlan
 from app.runtime_config import get_bool, get_int
+from app.services.llm_client import get_openrouter_client
 from app.services.retry import with_retry
 
 
 class ThreadPlannerAgent(BaseAgent):
     def __init__(self):
         super().__init__("ThreadPlannerAgent")
-        self.client = OpenAI(
-            base_url=settings.OPENROUTER_BASE_URL,
-            api_key=settings.OPENROUTER_API_KEY,
-        )
+        self.client = get_openrouter_client()
 
     def run(self, input_data: tuple[TopicPlan, Materials, StyleProfile]) -> ThreadPlan:
         topic_plan, materials, style = input_data
@@ -60,8 +56,7 @@ Return JSON:
                 ),
                 max_attempts=3,
             )
-            data = json.loads(resp.choices[0].message.content)
-            return ThreadPlan(**data)
+            return ThreadPlan.model_validate_json(resp.choices[0].message.content or "")
         except Exception:
             chunks: list[list[str]] = []
             points = topic_plan.key_points[:tweets_count]
@@ -1,21 +1,17 @@
 import json
 from datetime import datetime
 
-from openai import OpenAI
-
 from app.agents.base import BaseAgent
 from app.config import settings
 from app.models import WeeklyReport
+from app.services.llm_client import get_openrouter_client
 from app.services.retry import with_retry
 
 
 class WeeklyAnalystAgent(BaseAgent):
     def __init__(self):
         super().__init__("WeeklyAnalystAgent")
-        self.client = OpenAI(
-            base_url=settings.OPENROUTER_BASE_URL,
-            api_key=settings.OPENROUTER_API_KEY,
-        )
+        self.client = get_openrouter_client()
 
     def run(self, input_data: tuple[datetime, datetime, list[str]]) -> WeeklyReport:
         week_start, week_end, posts = input_data
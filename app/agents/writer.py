@@ -1,7 +1,5 @@
 import json
 
-from openai import OpenAI
-
 from app.agents.base import BaseAgent
 from app.config import settings
 from app.models import (
@@ -11,16 +9,14 @@ from app.models import (
     ThreadPlan,
     TopicPlan,
 )
+from app.services.llm_client import get_openrouter_client
 from app.services.retry import with_retry
 
 
 class WriterAgent(BaseAgent):
     def __init__(self):
         super().__init__("WriterAgent")
-        self.client = OpenAI(
-            base_url=settings.OPENROUTER_BASE_URL,
-            api_key=settings.OPENROUTER_API_KEY,
-        )
+        self.client = get_openrouter_client()
 
     def run(
         self, input_data: tuple[TopicPlan, ThreadPlan, StyleProfile, Materials]
@@ -100,5 +96,4 @@ Return JSON only:
             ),
             max_attempts=3,
         )
-        data = json.loads(response.choices[0].message.content)
-        return DraftCandidates(**data)
+        return DraftCandidates.model_validate_json(response.choices[0].message.content or "")
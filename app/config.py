@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -42,6 +44,7 @@ class Settings(BaseSettings):
     OPENROUTER_API_KEY: str = ""
     OPENROUTER_MODEL: str = "openai/gpt-4o-mini"
     OPENROUTER_BASE_URL: str = "https://openrouter.ai/api/v1"
+    LLM_CACHE_TTL_SECONDS: int = 0
 
     # Twitter
     TWITTER_API_KEY: str = ""
@@ -122,7 +125,22 @@ class Settings(BaseSettings):
 
     @property
     def sensitive_words_list(self) -> list[str]:
-        return [w.strip() for w in self.SENSITIVE_WORDS.split(",") if w.strip()]
+        return list(_split_csv(self.SENSITIVE_WORDS))
+
+    @property
+    def cors_origins_list(self) -> list[str]:
+        return list(_split_csv(self.CORS_ORIGINS or ""))
+
+    @property
+    def allowed_hosts_list(self) -> list[str]:
+        return list(_split_csv(self.ALLOWED_HOSTS or "*"))
+
+
+# Keyed on the raw string rather than cached on the instance, so a reassigned
+# setting is still picked up.
+@lru_cache(maxsize=16)
+def _split_csv(raw: str) -> tuple[str, ...]:
+    return tuple(w.strip() for w in raw.split(",") if w.strip())
 
 
 settings = Settings()
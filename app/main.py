@@ -1,7 +1,7 @@
 import logging
 import time
 import uuid
-from collections import defaultdict, deque
+from collections import OrderedDict
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
@@ -48,11 +48,6 @@ if bool(getattr(settings, "SENTRY_ENABLED", False)) and getattr(settings, "SENTR
         logger.exception("Failed to initialize Sentry")
 
 
-def _cors_origins() -> list[str]:
-    raw = getattr(settings, "CORS_ORIGINS", "") or ""
-    return [o.strip() for o in raw.split(",") if o.strip()]
-
-
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Starting Daily X Agent...")
@@ -81,14 +76,11 @@ async def lifespan(app: FastAPI):
 
 app = FastAPI(title="Daily X Agent", lifespan=lifespan)
 
-allowed_hosts = (getattr(settings, "ALLOWED_HOSTS", "*") or "*").strip()
-if allowed_hosts != "*":
-    app.add_middleware(
-        TrustedHostMiddleware,
-        allowed_hosts=[h.strip() for h in allowed_hosts.split(",") if h.strip()],
-    )
+allowed_hosts = settings.allowed_hosts_list
+if allowed_hosts and allowed_hosts != ["*"]:
+    app.add_middleware(TrustedHostMiddleware, allowed_hosts=allowed_hosts)
 
-origins = _cors_origins()
+origins = settings.cors_origins_list
 if origins:
     app.add_middleware(
         CORSMiddleware,
@@ -117,7 +109,21 @@ if str(getattr(settings, "METRICS_ENABLED", "true")).lower() == "true":
     if isinstance(metrics_path, str) and metrics_path.strip() and metrics_path != "/metrics":
         app.add_api_route(metrics_path, metrics_endpoint_response, methods=["GET"])
 
-_rate_limit_windows: dict[tuple[str, str], deque[float]] = defaultdict(deque)
+_RATE_LIMIT_MAX_KEYS = 10_000
+
+
+class _RateWindow:
+    """Ring of the last ``limit`` allowed request times; ``head`` is the oldest."""
+
+    __slots__ = ("head", "stamps")
+
+    def __init__(self, limit: int) -> None:
+        self.stamps = [float("-inf")] * limit
+        self.head = 0
+
+
+# Least recently seen (bucket, ip) first, so the map stays bounded under many clients.
+_rate_limit_windows: OrderedDict[tuple[str, str], _RateWindow] = OrderedDict()
 
 
 def _rate_limit_key(path: str, method: str) -> str | None:
@@ -147,12 +153,19 @@ def _rate_limit_key(path: str, method: str) -> str | None:
 
 def _check_rate_limit(bucket: str, ip: str, limit: int, window_seconds: int = 60) -> bool:
     now = time.monotonic()
-    window = _rate_limit_windows[(bucket, ip)]
-    while window and now - window[0] > window_seconds:
-        window.popleft()
-    if len(window) >= limit:
+    key = (bucket, ip)
+    window = _rate_limit_windows.get(key)
+    if window is None or len(window.stamps) != limit:
+        window = _RateWindow(limit)
+        _rate_limit_windows[key] = window
+    _rate_limit_windows.move_to_end(key)
+    if len(_rate_limit_windows) > _RATE_LIMIT_MAX_KEYS:
+        _rate_limit_windows.popitem(last=False)
+    # Over the limit while the oldest of the last ``limit`` allowed requests is in the window.
+    if now - window.stamps[window.head] <= window_seconds:
         return False
-    window.append(now)
+    window.stamps[window.head] = now
+    window.head = (window.head + 1) % limit
     return True
 
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import logging
 import logging.config
+import math
 import sys
 from contextvars import ContextVar
 from datetime import UTC, datetime
@@ -57,11 +58,43 @@ def reset_correlation_ids(tokens: dict[ContextVar[str | None], Any]) -> None:
             continue
 
 
+try:
+    from opentelemetry.trace import get_current_span
+except Exception:
+    get_current_span = None  # type: ignore[assignment]
+
+# LogRecord attributes that are not caller-supplied extras.
+_RECORD_ATTRS = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "levelname",
+        "levelno",
+        "pathname",
+        "filename",
+        "module",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        "lineno",
+        "funcName",
+        "created",
+        "msecs",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "processName",
+        "process",
+        "message",
+    }
+)
+_JSON_SCALARS = (str, int, float, type(None))
+
+
 def _get_trace_context() -> tuple[str | None, str | None]:
     try:
-        from opentelemetry.trace import get_current_span
-
-        span = get_current_span()
+        span = get_current_span() if get_current_span is not None else None
         if not span:
             return None, None
         ctx = span.get_span_context()
@@ -78,9 +111,27 @@ class JsonFormatter(logging.Formatter):
     def __init__(self, service_name: str):
         super().__init__()
         self.service_name = service_name
+        # (epoch second, its ISO prefix): records arrive in bursts within the same second.
+        self._second_prefix: tuple[int, str] = (-1, "")
+
+    def _timestamp(self, created: float) -> str:
+        # Same string as datetime.fromtimestamp(created, tz=UTC).isoformat(), including
+        # its half-even microsecond rounding and omitted fraction at zero microseconds,
+        # but only the seconds prefix goes through datetime, once per second.
+        frac, whole = math.modf(created)
+        second = int(whole)
+        micros = round(frac * 1e6)
+        if micros >= 1_000_000:
+            second += 1
+            micros -= 1_000_000
+        cached_second, prefix = self._second_prefix
+        if cached_second != second:
+            prefix = datetime.fromtimestamp(second, tz=UTC).isoformat()[:-6]
+            self._second_prefix = (second, prefix)
+        return f"{prefix}.{micros:06d}+00:00" if micros else f"{prefix}+00:00"
 
     def format(self, record: logging.LogRecord) -> str:
-        ts = datetime.fromtimestamp(record.created, tz=UTC).isoformat()
+        ts = self._timestamp(record.created)
         trace_id, span_id = _get_trace_context()
         request_id = get_request_id()
         run_id = get_run_id()
@@ -112,29 +163,10 @@ class JsonFormatter(logging.Formatter):
             payload["exc_info"] = self.formatException(record.exc_info)
 
         for k, v in record.__dict__.items():
-            if k in {
-                "name",
-                "msg",
-                "args",
-                "levelname",
-                "levelno",
-                "pathname",
-                "filename",
-                "module",
-                "exc_info",
-                "exc_text",
-                "stack_info",
-                "lineno",
-                "funcName",
-                "created",
-                "msecs",
-                "relativeCreated",
-                "thread",
-                "threadName",
-                "processName",
-                "process",
-                "message",
-            }:
+            if k in _RECORD_ATTRS:
+                continue
+            if isinstance(v, _JSON_SCALARS):
+                payload[k] = v
                 continue
             try:
                 json.dumps(v)
@@ -1,93 +1,128 @@
 from __future__ import annotations
 
+import gzip
 import time
-from collections.abc import Awaitable, Callable
 from typing import cast
 
 from fastapi import Response
-from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
-from starlette.middleware.base import BaseHTTPMiddleware
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
 from starlette.requests import Request
-from starlette.responses import Response as StarletteResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Only this app's metrics are exposed; the default registry's process/platform
+# collectors are not re-collected on every scrape.
+REGISTRY = CollectorRegistry()
 
 RUNS_TOTAL = Counter(
     "runs_total",
     "Total orchestrator runs started",
     labelnames=("source",),
+    registry=REGISTRY,
 )
 RUNS_FAILED_TOTAL = Counter(
     "runs_failed_total",
     "Total orchestrator runs failed",
     labelnames=("source",),
+    registry=REGISTRY,
 )
 JOB_LATENCY_SECONDS = Histogram(
     "job_latency_seconds",
     "Job latency in seconds",
     labelnames=("job",),
     buckets=(0.25, 0.5, 1, 2, 5, 10, 30, 60, 120, 300, 600),
+    registry=REGISTRY,
 )
 NOTIFY_TOTAL = Counter(
     "notify_total",
     "Notifications attempted",
     labelnames=("channel", "status"),
+    registry=REGISTRY,
 )
 PUBLISH_TOTAL = Counter(
     "publish_total",
     "Publish attempts",
     labelnames=("status", "dry_run"),
+    registry=REGISTRY,
 )
 POLICY_FAIL_TOTAL = Counter(
     "policy_fail_total",
     "Policy failures (non-PASS outcomes)",
     labelnames=("action",),
+    registry=REGISTRY,
 )
 AGENT_LATENCY_SECONDS = Histogram(
     "agent_latency_seconds",
     "Agent execution latency in seconds",
     labelnames=("agent",),
     buckets=(0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 30, 60),
+    registry=REGISTRY,
 )
 
 HTTP_REQUESTS_TOTAL = Counter(
     "http_requests_total",
     "Total HTTP requests",
     labelnames=("method", "path", "status"),
+    registry=REGISTRY,
 )
 HTTP_REQUEST_DURATION_SECONDS = Histogram(
     "http_request_duration_seconds",
     "HTTP request duration in seconds",
     labelnames=("method", "path"),
     buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10),
+    registry=REGISTRY,
 )
 
-DB_RUNS_TOTAL = Gauge("dailyx_runs_total", "Runs total", labelnames=("status",))
-DB_DRAFTS_TOTAL = Gauge("dailyx_drafts_total", "Drafts total")
-DB_POSTS_TOTAL = Gauge("dailyx_posts_total", "Posts total")
-DB_AVG_RUN_DURATION_MS = Gauge("dailyx_run_duration_avg_ms", "Average run duration ms")
+DB_RUNS_TOTAL = Gauge("dailyx_runs_total", "Runs total", labelnames=("status",), registry=REGISTRY)
+DB_DRAFTS_TOTAL = Gauge("dailyx_drafts_total", "Drafts total", registry=REGISTRY)
+DB_POSTS_TOTAL = Gauge("dailyx_posts_total", "Posts total", registry=REGISTRY)
+DB_AVG_RUN_DURATION_MS = Gauge(
+    "dailyx_run_duration_avg_ms", "Average run duration ms", registry=REGISTRY
+)
 
 
-def _route_path(request: Request) -> str:
-    route = request.scope.get("route")
+def _route_path(scope: Scope) -> str:
+    route = scope.get("route")
     path = cast(str | None, getattr(route, "path", None))
     if path and isinstance(path, str):
         return path
-    return request.url.path
+    return cast(str, scope.get("path", ""))
+
 
+class PrometheusMiddleware:
+    """Pure ASGI middleware: times the call in place instead of via BaseHTTPMiddleware,
+    which spawns a task and streams the response body per request."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-class PrometheusMiddleware(BaseHTTPMiddleware):
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[StarletteResponse]]
-    ) -> StarletteResponse:
         start = time.perf_counter()
-        path = _route_path(request)
-        method = request.method
         status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
         try:
-            response = await call_next(request)
-            status_code = response.status_code
-            return response
+            await self.app(scope, receive, send_wrapper)
         finally:
             duration = time.perf_counter() - start
+            # The router sets scope["route"] while handling, so resolve the path afterwards.
+            path = _route_path(scope)
+            method = scope["method"]
             HTTP_REQUESTS_TOTAL.labels(method=method, path=path, status=str(status_code)).inc()
             HTTP_REQUEST_DURATION_SECONDS.labels(method=method, path=path).observe(duration)
 
@@ -98,23 +133,23 @@ def _update_db_gauges() -> None:
     if str(getattr(settings, "METRICS_INCLUDE_DB", "true")).lower() != "true":
         return
 
-    from infrastructure.db.repositories import (
-        avg_run_duration_ms,
-        drafts_count,
-        posts_count,
-        runs_grouped_by_status,
-    )
+    from infrastructure.db.repositories import db_metrics_snapshot
     from infrastructure.db.session import get_sessionmaker
 
     with get_sessionmaker()() as session:
-        for status, count in runs_grouped_by_status(session):
-            DB_RUNS_TOTAL.labels(status=status).set(count)
-        DB_DRAFTS_TOTAL.set(drafts_count(session))
-        DB_POSTS_TOTAL.set(posts_count(session))
-        DB_AVG_RUN_DURATION_MS.set(avg_run_duration_ms(session))
+        runs_by_status, drafts, posts, avg_run_ms = db_metrics_snapshot(session)
+    for status, count in runs_by_status:
+        DB_RUNS_TOTAL.labels(status=status).set(count)
+    DB_DRAFTS_TOTAL.set(drafts)
+    DB_POSTS_TOTAL.set(posts)
+    DB_AVG_RUN_DURATION_MS.set(avg_run_ms)
 
 
-def metrics_endpoint_response() -> Response:
+def metrics_endpoint_response(request: Request) -> Response:
     _update_db_gauges()
-    data = generate_latest()
-    return Response(content=data, media_type=CONTENT_TYPE_LATEST)
+    data = generate_latest(REGISTRY)
+    headers = {"Vary": "Accept-Encoding"}
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        data = gzip.compress(data)
+        headers["Content-Encoding"] = "gzip"
+    return Response(content=data, media_type=CONTENT_TYPE_LATEST, headers=headers)
@@ -3,6 +3,7 @@ from __future__ import annotations
 from fastapi import FastAPI
 
 _otel_initialized = False
+_http_clients_instrumented = False
 
 
 def _parse_headers(raw: str) -> dict[str, str]:
@@ -57,9 +58,8 @@ def setup_otel(
     if not enabled:
         return
 
+    global _http_clients_instrumented
     from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
-    from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
-    from opentelemetry.instrumentation.requests import RequestsInstrumentor
 
     _init_tracing(
         service_name=service_name,
@@ -69,8 +69,16 @@ def setup_otel(
     )
 
     FastAPIInstrumentor.instrument_app(app)
+    # requests/httpx patching is process-wide; do it (and import it) only once.
+    if _http_clients_instrumented:
+        return
+
+    from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
+    from opentelemetry.instrumentation.requests import RequestsInstrumentor
+
     RequestsInstrumentor().instrument()
     HTTPXClientInstrumentor().instrument()
+    _http_clients_instrumented = True
 
 
 def setup_otel_worker(
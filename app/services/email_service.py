@@ -3,6 +3,7 @@ import smtplib
 from contextlib import suppress
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from functools import lru_cache
 
 from sendgrid import SendGridAPIClient
 from sendgrid.helpers.mail import Mail
@@ -30,8 +31,12 @@ def _send_sendgrid(subject: str, html: str) -> None:
         subject=subject,
         html_content=html,
     )
-    sg = SendGridAPIClient(settings.SENDGRID_API_KEY)
-    sg.send(message)
+    _sendgrid_client(settings.SENDGRID_API_KEY).send(message)
+
+
+@lru_cache(maxsize=1)
+def _sendgrid_client(api_key: str) -> SendGridAPIClient:
+    return SendGridAPIClient(api_key)
 
 
 def _send_smtp(subject: str, html: str) -> None:
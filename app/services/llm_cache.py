@@ -0,0 +1,46 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+from app.config import settings
+
+_MAX_ENTRIES = 128
+
+_lock = threading.Lock()
+_entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+
+def _cache_key(model: str, prompt: str) -> str:
+    return hashlib.sha256(f"{model}\0{prompt}".encode()).hexdigest()
+
+
+def cached_json_completion(model: str, prompt: str, call: Callable[[], str | None]) -> Any:
+    """Parse the JSON returned by ``call``, reusing it for an identical (model, prompt).
+
+    Only responses that parse are stored. ``LLM_CACHE_TTL_SECONDS <= 0`` disables the
+    cache and every call goes to the provider.
+    """
+    ttl_s = int(getattr(settings, "LLM_CACHE_TTL_SECONDS", 0) or 0)
+    if ttl_s <= 0:
+        return json.loads(call() or "")
+
+    key = _cache_key(model, prompt)
+    now = time.monotonic()
+    with _lock:
+        hit = _entries.get(key)
+        if hit is not None and hit[0] > now:
+            _entries.move_to_end(key)
+            return json.loads(hit[1])
+
+    content = call() or ""
+    data = json.loads(content)
+    with _lock:
+        _entries[key] = (now + ttl_s, content)
+        _entries.move_to_end(key)
+        while len(_entries) > _MAX_ENTRIES:
+            _entries.popitem(last=False)
+    return data
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+from app.config import settings
+
+if TYPE_CHECKING:
+    from openai import OpenAI
+
+_lock = threading.Lock()
+_client: OpenAI | None = None
+
+
+def get_openrouter_client() -> OpenAI:
+    """Return the process-wide OpenRouter client.
+
+    Every agent shares one client, and therefore one keep-alive pool, so a run's
+    successive LLM calls reuse warm connections instead of each agent paying its own
+    TCP/TLS setup. The SDK is imported on first use; it is slow to import and
+    processes that never reach an LLM call should not pay for it.
+    """
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                from openai import OpenAI
+
+                _client = OpenAI(
+                    base_url=settings.OPENROUTER_BASE_URL,
+                    api_key=settings.OPENROUTER_API_KEY,
+                )
+    return _client
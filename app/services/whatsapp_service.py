@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from twilio.rest import Client as TwilioClient
 
 from app.config import settings
@@ -13,9 +15,16 @@ def send_whatsapp(body: str) -> None:
 def _send(body: str) -> None:
     if not settings.TWILIO_ACCOUNT_SID or not settings.TWILIO_AUTH_TOKEN:
         raise RuntimeError("Twilio credentials missing")
-    client = TwilioClient(settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN)
+    client = _twilio_client(settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN)
     client.messages.create(
         from_=settings.TWILIO_FROM_NUMBER,
         to=settings.TWILIO_TO_NUMBER,
         body=body,
     )
+
+
+@lru_cache(maxsize=1)
+def _twilio_client(account_sid: str, auth_token: str) -> TwilioClient:
+    # The client's HTTP session keeps its connection to Twilio alive between messages;
+    # keyed on the credentials so rotated ones get a fresh client.
+    return TwilioClient(account_sid, auth_token)
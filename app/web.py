@@ -169,10 +169,10 @@ def health():
     summary="Prometheus metrics",
     description="Prometheus text exposition format.",
 )
-def metrics():
+def metrics(request: Request):
     if str(getattr(settings, "METRICS_ENABLED", "true")).lower() != "true":
         return JSONResponse({"enabled": False}, status_code=404)
-    return metrics_endpoint_response()
+    return metrics_endpoint_response(request)
 
 
 @router.get("/login", response_class=HTMLResponse, include_in_schema=False)
@@ -292,10 +292,10 @@ def api_health():
     summary="Prometheus metrics (API)",
     description="Prometheus text exposition format.",
 )
-def api_metrics():
+def api_metrics(request: Request):
     if str(getattr(settings, "METRICS_ENABLED", "true")).lower() != "true":
         return JSONResponse({"enabled": False}, status_code=404)
-    return metrics_endpoint_response()
+    return metrics_endpoint_response(request)
 
 
 @router.get("/api/auth/csrf", tags=["auth"], summary="Issue login CSRF cookie")
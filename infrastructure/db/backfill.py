@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import sqlalchemy as sa
+from sqlalchemy.engine import Connection, RowMapping
+
+from alembic import op
+
+DEFAULT_PAGE_SIZE = 2000
+
+
+def iter_pages(
+    conn: Connection,
+    table: sa.Table,
+    pk_name: str,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> Iterator[list[RowMapping]]:
+    pk = table.c[pk_name]
+    last: Any = None
+    while True:
+        stmt = sa.select(table).order_by(pk.asc()).limit(page_size)
+        if last is not None:
+            stmt = stmt.where(pk > last)
+        rows = list(conn.execute(stmt).mappings().all())
+        if not rows:
+            return
+        yield rows
+        last = rows[-1][pk_name]
+
+
+def update_pages(
+    conn: Connection,
+    table: sa.Table,
+    pk_name: str,
+    fn: Callable[[RowMapping], dict[str, Any] | None],
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> int:
+    """Apply ``fn`` to every row of ``table`` on ``conn``, one page at a time.
+
+    ``fn`` returns the column values to write for a row, or ``None`` to leave it
+    untouched. Rows are grouped by the set of columns they write, so rows that set
+    different columns never clobber each other's untouched columns with NULL.
+    """
+    pk = table.c[pk_name]
+    updated = 0
+    for rows in iter_pages(conn, table, pk_name, page_size):
+        groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+        for row in rows:
+            values = fn(row)
+            if values:
+                columns = tuple(sorted(values))
+                groups.setdefault(columns, []).append(
+                    {"b_pk": row[pk_name], **{f"b_{k}": v for k, v in values.items()}}
+                )
+        for columns, params in groups.items():
+            stmt = (
+                table.update()
+                .where(pk == sa.bindparam("b_pk"))
+                .values({c: sa.bindparam(f"b_{c}") for c in columns})
+            )
+            conn.execute(stmt, params)
+            updated += len(params)
+    return updated
+
+
+def paginated_update(
+    table: sa.Table,
+    pk_name: str,
+    fn: Callable[[RowMapping], dict[str, Any] | None],
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> int:
+    """Backfill rows page by page using keyset pagination on ``pk_name``.
+
+    See ``update_pages`` for the contract of ``fn``. The work runs inside an autocommit
+    block, so memory stays bounded by ``page_size`` and no transaction spans the whole
+    table. The unit of commit is one UPDATE statement (one column group of one page),
+    not a page: a run that fails halfway can leave a page partly written, so ``fn``
+    must be idempotent and the migration safe to re-run. Online migrations only.
+    """
+    with op.get_context().autocommit_block():
+        return update_pages(op.get_bind(), table, pk_name, fn, page_size)
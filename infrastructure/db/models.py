@@ -2,7 +2,18 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Identity,
+    Index,
+    Integer,
+    String,
+    Text,
+    text,
+)
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 from sqlalchemy.types import JSON
@@ -12,6 +23,10 @@ def _json_type():
     return JSONB().with_variant(JSON(), "sqlite")
 
 
+def _bigint_id():
+    return BigInteger().with_variant(Integer(), "sqlite")
+
+
 class Base(DeclarativeBase):
     pass
 
@@ -37,11 +52,11 @@ class Draft(Base):
     __tablename__ = "drafts"
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
-    token: Mapped[str] = mapped_column(String(64), nullable=False, unique=True)
+    token: Mapped[str] = mapped_column(String(64), nullable=False)
     run_id: Mapped[str] = mapped_column(ForeignKey("runs.run_id"), nullable=False, index=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
-    status: Mapped[str] = mapped_column(String(40), nullable=False, default="pending", index=True)
+    status: Mapped[str] = mapped_column(String(40), nullable=False, default="pending")
 
     token_consumed: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     consumed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -80,11 +95,13 @@ class Draft(Base):
         back_populates="draft", cascade="all, delete-orphan"
     )
 
+    __table_args__ = (Index("ix_drafts_status_created_at", "status", "created_at"),)
+
 
 class Post(Base):
     __tablename__ = "posts"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(_bigint_id(), Identity(always=False), primary_key=True)
     draft_id: Mapped[str] = mapped_column(ForeignKey("drafts.id"), nullable=False, index=True)
     position: Mapped[int] = mapped_column(Integer, nullable=False)
     tweet_id: Mapped[str] = mapped_column(String(120), nullable=False, unique=True)
@@ -100,7 +117,7 @@ class Post(Base):
 class PublishAttempt(Base):
     __tablename__ = "publish_attempts"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(_bigint_id(), Identity(always=False), primary_key=True)
     draft_id: Mapped[str] = mapped_column(ForeignKey("drafts.id"), nullable=False, index=True)
     attempt: Mapped[int] = mapped_column(Integer, nullable=False)
     owner: Mapped[str | None] = mapped_column(String(80), nullable=True)
@@ -130,13 +147,20 @@ class ActionToken(Base):
 
     draft: Mapped[Draft] = relationship(back_populates="action_tokens")
 
-    __table_args__ = (Index("ix_action_tokens_action_draft", "action", "draft_id"),)
+    __table_args__ = (
+        Index(
+            "ix_action_tokens_action_draft",
+            "action",
+            "draft_id",
+            postgresql_where=text("consumed_at IS NULL"),
+        ),
+    )
 
 
 class AgentLog(Base):
     __tablename__ = "agent_logs"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(_bigint_id(), Identity(always=False), primary_key=True)
     run_id: Mapped[str] = mapped_column(ForeignKey("runs.run_id"), nullable=False, index=True)
 
     agent_name: Mapped[str] = mapped_column(String(80), nullable=False)
@@ -155,7 +179,7 @@ class AgentLog(Base):
 class PolicyReport(Base):
     __tablename__ = "policy_reports"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(_bigint_id(), Identity(always=False), primary_key=True)
     draft_id: Mapped[str] = mapped_column(ForeignKey("drafts.id"), nullable=False, index=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     action: Mapped[str] = mapped_column(String(20), nullable=False)
@@ -232,7 +256,7 @@ class UserSession(Base):
 class AuditLog(Base):
     __tablename__ = "audit_logs"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(_bigint_id(), Identity(always=False), primary_key=True)
     user_id: Mapped[str] = mapped_column(ForeignKey("users.id"), nullable=False, index=True)
     action: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
     draft_id: Mapped[str | None] = mapped_column(ForeignKey("drafts.id"), nullable=True, index=True)
@@ -4,9 +4,10 @@ import hashlib
 import secrets
 import uuid
 from datetime import UTC, datetime, timedelta
+from typing import Any
 
 import bcrypt
-from sqlalchemy import Select, func, select
+from sqlalchemy import CompoundSelect, Select, String, cast, func, literal, null, select, union_all
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -459,23 +460,33 @@ def save_weekly_report(session: Session, report: WeeklyReport) -> None:
     )
 
 
-def runs_grouped_by_status(session: Session) -> list[tuple[str, int]]:
-    stmt = select(models.Run.status, func.count(models.Run.run_id)).group_by(models.Run.status)
-    return [(str(status), int(count)) for status, count in session.execute(stmt).all()]
-
-
-def drafts_count(session: Session) -> int:
-    return int(session.execute(select(func.count(models.Draft.id))).scalar_one())
-
-
-def posts_count(session: Session) -> int:
-    return int(session.execute(select(func.count(models.Post.id))).scalar_one())
-
-
-def avg_run_duration_ms(session: Session) -> float:
-    stmt = select(func.avg(models.Run.duration_ms)).where(models.Run.duration_ms.is_not(None))
-    value = session.execute(stmt).scalar_one()
-    return float(value or 0.0)
+def db_metrics_snapshot(session: Session) -> tuple[list[tuple[str, int]], int, int, float]:
+    """Runs by status, draft and post totals and mean run duration, in one round trip."""
+    no_label = cast(null(), String)
+    stmt: CompoundSelect[tuple[str, str | None, Any]] = union_all(
+        select(literal("runs"), models.Run.status, func.count(models.Run.run_id)).group_by(
+            models.Run.status
+        ),
+        select(literal("drafts"), no_label, func.count(models.Draft.id)),
+        select(literal("posts"), no_label, func.count(models.Post.id)),
+        select(literal("avg_run_ms"), no_label, func.avg(models.Run.duration_ms)).where(
+            models.Run.duration_ms.is_not(None)
+        ),
+    )
+    runs_by_status: list[tuple[str, int]] = []
+    totals: dict[str, float] = {}
+    for row in session.execute(stmt):
+        metric, label, value = row[0], row[1], row[2]
+        if metric == "runs":
+            runs_by_status.append((str(label), int(value)))
+        else:
+            totals[str(metric)] = float(value or 0.0)
+    return (
+        runs_by_status,
+        int(totals.get("drafts", 0)),
+        int(totals.get("posts", 0)),
+        totals.get("avg_run_ms", 0.0),
+    )
 
 
 def hash_password(raw_password: str) -> str:
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from collections.abc import Generator
+from typing import Any
 
-from sqlalchemy import Engine, create_engine
+from sqlalchemy import Engine, create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
@@ -18,10 +19,27 @@ def create_engine_from_url(url: str) -> Engine:
                 connect_args=connect_args,
                 poolclass=StaticPool,
             )
-        return create_engine(url, connect_args=connect_args)
+        engine = create_engine(url, connect_args=connect_args)
+        event.listen(engine, "connect", _tune_sqlite_connection)
+        return engine
     return create_engine(url, pool_pre_ping=True)
 
 
+def _tune_sqlite_connection(dbapi_connection: Any, _connection_record: Any) -> None:
+    # WAL lets readers (dashboards, metrics gauges) run alongside the pipeline's writes
+    # and only syncs at checkpoints, which makes synchronous=NORMAL safe. Filesystems
+    # that cannot do WAL keep the rollback journal and the default FULL sync.
+    cursor = dbapi_connection.cursor()
+    try:
+        row = cursor.execute("PRAGMA journal_mode=WAL").fetchone()
+        if row and str(row[0]).lower() == "wal":
+            cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA cache_size=-20000")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+    finally:
+        cursor.close()
+
+
 _engine: Engine | None = None
 _SessionLocal: sessionmaker[Session] | None = None
 
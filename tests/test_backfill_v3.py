@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from infrastructure.db.backfill import update_pages
+
+
+def test_update_pages_walks_every_page_and_keeps_untouched_columns() -> None:
+    metadata = sa.MetaData()
+    items = sa.Table(
+        "items",
+        metadata,
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("label", sa.String(20), nullable=True),
+        sa.Column("score", sa.Integer(), nullable=True),
+    )
+    engine = sa.create_engine("sqlite+pysqlite:///:memory:")
+    metadata.create_all(engine)
+
+    def fn(row):
+        if row["id"] == 3:
+            return None
+        if row["id"] % 2:
+            return {"label": f"odd-{row['id']}"}
+        return {"label": f"even-{row['id']}", "score": row["id"] * 10}
+
+    with engine.begin() as conn:
+        conn.execute(items.insert(), [{"id": i, "label": "old", "score": 1} for i in range(1, 8)])
+        updated = update_pages(conn, items, "id", fn, page_size=2)
+        rows = conn.execute(sa.select(items).order_by(items.c.id)).all()
+
+    assert updated == 6
+    assert [tuple(r) for r in rows] == [
+        (1, "odd-1", 1),
+        (2, "even-2", 20),
+        (3, "old", 1),
+        (4, "even-4", 40),
+        (5, "odd-5", 1),
+        (6, "even-6", 60),
+        (7, "odd-7", 1),
+    ]
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from app.agents.collector import CollectorAgent
+from app.config import settings
+from app.models import RunState
+
+
+def test_collector_picks_up_settings_changed_between_runs(monkeypatch, tmp_path):
+    first = tmp_path / "first.md"
+    second = tmp_path / "second.md"
+    first.write_text("first devlog")
+    second.write_text("second devlog")
+    monkeypatch.setattr(settings, "GIT_REPO_PATH", str(tmp_path))
+    monkeypatch.setattr(settings, "DEVLOG_PATH", str(first))
+    state = RunState(run_id="r1", created_at=datetime.now(UTC), source="test")
+
+    agent = CollectorAgent()
+    materials = agent.run(state)
+    assert materials.devlog is not None
+    assert materials.devlog.raw_snippet == "first devlog"
+
+    monkeypatch.setattr(settings, "DEVLOG_PATH", str(second))
+    materials = agent.run(state)
+    assert materials.devlog is not None
+    assert materials.devlog.raw_snippet == "second devlog"
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from app.config import settings
+from app.services import llm_cache
+
+
+def test_llm_cache_reuses_identical_prompts(monkeypatch):
+    monkeypatch.setattr(settings, "LLM_CACHE_TTL_SECONDS", 60)
+    monkeypatch.setattr(llm_cache, "_entries", type(llm_cache._entries)())
+    calls: list[str] = []
+
+    def call() -> str:
+        calls.append("x")
+        return '{"topic_bucket": 1}'
+
+    assert llm_cache.cached_json_completion("m", "prompt", call) == {"topic_bucket": 1}
+    assert llm_cache.cached_json_completion("m", "prompt", call) == {"topic_bucket": 1}
+    assert llm_cache.cached_json_completion("other", "prompt", call) == {"topic_bucket": 1}
+    assert len(calls) == 2
+
+
+def test_llm_cache_disabled_by_default(monkeypatch):
+    monkeypatch.setattr(settings, "LLM_CACHE_TTL_SECONDS", 0)
+    calls: list[str] = []
+
+    def call() -> str:
+        calls.append("x")
+        return "{}"
+
+    llm_cache.cached_json_completion("m", "prompt", call)
+    llm_cache.cached_json_completion("m", "prompt", call)
+    assert len(calls) == 2
@@ -1,6 +1,11 @@
+from datetime import UTC, datetime
+
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 
 from app.main import app
+from infrastructure.db import repositories as db
+from infrastructure.db.session import get_engine, get_sessionmaker
 
 
 def test_metrics_endpoint_exposes_prometheus() -> None:
@@ -8,5 +13,35 @@ def test_metrics_endpoint_exposes_prometheus() -> None:
     resp = client.get("/metrics")
     assert resp.status_code == 200
     assert "text/plain" in resp.headers.get("content-type", "")
+    assert resp.headers.get("content-encoding") == "gzip"
     body = resp.text
     assert "http_requests_total" in body
+    assert "process_cpu_seconds_total" not in body
+
+
+def test_db_metrics_snapshot_aggregates_in_one_query(clean_db) -> None:
+    now = datetime.now(UTC)
+    with get_sessionmaker()() as session:
+        assert db.db_metrics_snapshot(session) == ([], 0, 0, 0.0)
+        db.create_run(session, run_id="r1", source="test", created_at=now)
+        db.create_run(session, run_id="r2", source="test", created_at=now)
+        db.create_run(session, run_id="r3", source="test", created_at=now)
+        session.flush()
+        db.update_run_status(session, "r1", "completed", now, 100, None)
+        db.update_run_status(session, "r2", "completed", now, 300, None)
+        session.commit()
+
+        statements: list[str] = []
+
+        def count(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(get_engine(), "before_cursor_execute", count)
+        try:
+            runs_by_status, drafts, posts, avg_run_ms = db.db_metrics_snapshot(session)
+        finally:
+            event.remove(get_engine(), "before_cursor_execute", count)
+
+    assert len(statements) == 1
+    assert sorted(runs_by_status) == [("completed", 2), ("running", 1)]
+    assert (drafts, posts, avg_run_ms) == (0, 0, 200.0)
@@ -1,7 +1,13 @@
+import time
 from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
 
+import pytest
+import requests
+import tweepy
 from sqlalchemy import select
 
+from app.agents import publisher
 from app.agents.publisher import PublisherAgent
 from app.models import (
     DraftCandidate,
@@ -67,3 +73,48 @@ def test_publisher_idempotent_thread_dry_run(clean_db):
             .order_by(models.Post.position.asc())
         ).all()
         assert len(rows) == 3
+
+
+def _too_many_requests(reset_in_s: float) -> tweepy.TooManyRequests:
+    response = requests.Response()
+    response.status_code = 429
+    response.reason = "Too Many Requests"
+    response.headers["x-rate-limit-reset"] = str(int(time.time() + reset_in_s))
+    response._content = b"{}"
+    return tweepy.TooManyRequests(response)
+
+
+class _FlakyClient:
+    def __init__(self, errors: list[Exception]):
+        self.errors = errors
+        self.calls = 0
+
+    def create_tweet(self, text: str, **kwargs):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return SimpleNamespace(data={"id": "123"})
+
+
+def test_publisher_waits_out_a_short_rate_limit(monkeypatch):
+    sleeps: list[float] = []
+    monkeypatch.setattr(publisher.time, "sleep", sleeps.append)
+    agent = PublisherAgent()
+    agent._tweepy_client = _FlakyClient([_too_many_requests(1)])
+
+    assert agent._post_with_retry("hello", None) == "123"
+    assert len(sleeps) == 1
+    assert sleeps[0] <= publisher._MAX_RATE_LIMIT_WAIT_S
+
+
+def test_publisher_fails_fast_when_rate_limit_resets_later(monkeypatch):
+    sleeps: list[float] = []
+    monkeypatch.setattr(publisher.time, "sleep", sleeps.append)
+    agent = PublisherAgent()
+    client = _FlakyClient([_too_many_requests(600)])
+    agent._tweepy_client = client
+
+    with pytest.raises(tweepy.TooManyRequests):
+        agent._post_with_retry("hello", None)
+    assert client.calls == 1
+    assert sleeps == []
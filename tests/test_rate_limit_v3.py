@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+
+from app import main
+
+
+def _frozen_clock(monkeypatch, start: float = 1000.0) -> list[float]:
+    clock = [start]
+    monkeypatch.setattr(main.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(main, "_rate_limit_windows", OrderedDict())
+    return clock
+
+
+def test_rate_limit_blocks_over_limit_until_window_rolls(monkeypatch):
+    clock = _frozen_clock(monkeypatch)
+
+    assert [main._check_rate_limit("auth", "1.1.1.1", limit=3) for _ in range(4)] == [
+        True,
+        True,
+        True,
+        False,
+    ]
+    clock[0] += 30
+    assert main._check_rate_limit("auth", "1.1.1.1", limit=3) is False
+    assert main._check_rate_limit("auth", "2.2.2.2", limit=3) is True
+
+    # The first three requests leave the 60s window; the slots free up one by one.
+    clock[0] += 31
+    assert [main._check_rate_limit("auth", "1.1.1.1", limit=3) for _ in range(4)] == [
+        True,
+        True,
+        True,
+        False,
+    ]
+
+
+def test_rate_limit_evicts_least_recently_seen_key(monkeypatch):
+    _frozen_clock(monkeypatch)
+    monkeypatch.setattr(main, "_RATE_LIMIT_MAX_KEYS", 2)
+
+    assert main._check_rate_limit("actions", "a", limit=1) is True
+    assert main._check_rate_limit("actions", "b", limit=1) is True
+    # Touching "a" makes "b" the least recently seen key.
+    assert main._check_rate_limit("actions", "a", limit=1) is False
+    assert main._check_rate_limit("actions", "c", limit=1) is True
+
+    assert list(main._rate_limit_windows) == [("actions", "a"), ("actions", "c")]
+    # "b" was evicted, so it starts over with a fresh window.
+    assert main._check_rate_limit("actions", "b", limit=1) is True